@@ -1,9 +1,10 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2021-2023 Hitalo M. <https://github.com/HitaloM>
 
+import asyncio
 import logging
 import platform
-from typing import BinaryIO, List, Union
+from typing import BinaryIO, Coroutine, List, Set, Union
 
 import aiocron
 import pyrogram
@@ -24,7 +25,7 @@ from androidrepo.config import (
     STAFF_ID,
     SUDO_USERS,
 )
-from androidrepo.utils import shell_exec
+from androidrepo.utils import http, shell_exec
 
 log = logging.getLogger(__name__)
 
@@ -46,12 +47,19 @@ class AndroidRepo(Client):
             sleep_threshold=180,
         )
 
+        # Keep references to fire-and-forget tasks until they finish
+        self.background_tasks: Set[asyncio.Task] = set()
+
     async def start(self):
         await super().start()
 
         # Save version info
-        self.version_code = int((await shell_exec("git rev-list --count HEAD"))[0])
-        self.version = str((await shell_exec("git rev-parse --short HEAD"))[0])
+        version_code, version = await asyncio.gather(
+            shell_exec("git rev-list --count HEAD"),
+            shell_exec("git rev-parse --short HEAD"),
+        )
+        self.version_code = int(version_code[0])
+        self.version = str(version[0])
 
         # Misc monkeypatch
         self.me = await self.get_me()
@@ -65,22 +73,28 @@ class AndroidRepo(Client):
             sentry_sdk.init(SENTRY_KEY, traces_sample_rate=1.0)
 
         log.info(
-            f"AndroidRepo for Pyrogram v{pyrogram.__version__} (Layer {layer}) started on @{self.me.username}. Hi."
+            "AndroidRepo for Pyrogram v%s (Layer %s) started on @%s. Hi.",
+            pyrogram.__version__,
+            layer,
+            self.me.username,
         )
 
         # Startup message
+        text = (
+            f"<b>AndroidRepo</b> <a href='https://github.com/AndroidRepo-OSS/Bot/commit/{self.version}'>{self.version}</a> (<code>{self.version_code}</code>) started!\n"
+            f"- <b>Pyrogram:</b> <code>v{pyrogram.__version__}</code>\n"
+            f"- <b>Python:</b> <code>v{platform.python_version()}</code>\n"
+            f"- <b>System:</b> <code>{self.system_version}</code>"
+        )
         try:
-            for user in self.is_sudo:
-                await self.send_message(
-                    chat_id=user,
-                    text=(
-                        f"<b>AndroidRepo</b> <a href='https://github.com/AndroidRepo-OSS/Bot/commit/{self.version}'>{self.version}</a> (<code>{self.version_code}</code>) started!\n"
-                        f"- <b>Pyrogram:</b> <code>v{pyrogram.__version__}</code>\n"
-                        f"- <b>Python:</b> <code>v{platform.python_version()}</code>\n"
-                        f"- <b>System:</b> <code>{self.system_version}</code>"
-                    ),
-                    disable_web_page_preview=True,
+            await asyncio.gather(
+                *(
+                    self.send_message(
+                        chat_id=user, text=text, disable_web_page_preview=True
+                    )
+                    for user in self.is_sudo
                 )
+            )
         except (BadRequest, ChatWriteForbidden):
             log.warning("Unable to send the startup message to the SUDO_USERS")
 
@@ -91,19 +105,45 @@ class AndroidRepo(Client):
             from androidrepo.modules.utils.xposed import check_lsposed
 
             # await check_modules(self)
-            await check_lsposed(self)
-            await check_quickpic(self)
-            await check_magisk(self)
+            checks = (check_lsposed, check_quickpic, check_magisk)
+            results = await asyncio.gather(
+                *(check(self) for check in checks), return_exceptions=True
+            )
+            for check, result in zip(checks, results):
+                if isinstance(result, Exception):
+                    log.error("%s failed", check.__name__, exc_info=result)
 
         aiocron.crontab("0 * * * *", func=magisk_sync, start=True)
 
     async def stop(self):
+        await asyncio.gather(*self.background_tasks, return_exceptions=True)
         await super().stop()
+        await http.aclose()
         log.info("AndroidRepo stopped... Bye.")
 
     async def send_log_message(self, chat_id: int, text: str, *args, **kwargs):
         return await self.send_message(chat_id=chat_id, text=text, *args, **kwargs)
 
+    def create_background_task(self, coro: Coroutine) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self.background_tasks.add(task)
+        task.add_done_callback(self._on_background_task_done)
+        return task
+
+    def _on_background_task_done(self, task: asyncio.Task) -> None:
+        self.background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            log.error(
+                "Background task %s failed",
+                task.get_coro().__qualname__,
+                exc_info=task.exception(),
+            )
+
+    def send_log_message_nowait(self, chat_id: int, text: str, *args, **kwargs):
+        self.create_background_task(
+            self.send_log_message(chat_id, text, *args, **kwargs)
+        )
+
     async def delete_log_messages(
         self, message_ids: Union[int, List[int]], *args, **kwargs
     ):
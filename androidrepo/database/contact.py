@@ -9,10 +9,17 @@ conn = database.get_conn()
 
 
 async def get_contact_by_id(user_id: int) -> Optional[Dict]:
-    cursor = await conn.execute("SELECT * FROM contact WHERE user = ?", (user_id,))
-    row = await cursor.fetchone()
-    await cursor.close()
-    return row
+    rows = await conn.execute_fetchall(
+        "SELECT * FROM contact WHERE user = ?", (user_id,)
+    )
+    return rows[0] if rows else None
+
+
+async def contact_exists(user_id: int) -> bool:
+    rows = await conn.execute_fetchall(
+        "SELECT 1 FROM contact WHERE user = ? LIMIT 1", (user_id,)
+    )
+    return bool(rows)
 
 
 async def create_contact(user_id: int) -> None:
@@ -22,8 +29,7 @@ async def create_contact(user_id: int) -> None:
     await conn.commit()
 
 
-async def delete_contact(user_id: int) -> None:
-    await conn.execute("DELETE FROM contact WHERE user = ?", (user_id,))
-    if conn.total_changes <= 0:
-        raise AssertionError
+async def delete_contact(user_id: int) -> bool:
+    cursor = await conn.execute("DELETE FROM contact WHERE user = ?", (user_id,))
     await conn.commit()
+    return cursor.rowcount > 0
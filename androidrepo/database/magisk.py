@@ -9,17 +9,15 @@ conn = database.get_conn()
 
 
 async def get_all_magisk() -> Dict:
-    cursor = await conn.execute("SELECT * FROM magisk")
-    rows = await cursor.fetchall()
-    await cursor.close()
+    rows = await conn.execute_fetchall("SELECT * FROM magisk")
     return rows
 
 
 async def get_magisk_by_branch(branch: str) -> Optional[Dict]:
-    cursor = await conn.execute("SELECT * FROM magisk WHERE branch = ?", (branch,))
-    row = await cursor.fetchone()
-    await cursor.close()
-    return row
+    rows = await conn.execute_fetchall(
+        "SELECT * FROM magisk WHERE branch = ?", (branch,)
+    )
+    return rows[0] if rows else None
 
 
 async def update_magisk_from_dict(branch: str, data: Dict) -> None:
@@ -57,19 +55,20 @@ async def create_magisk(
 
 
 async def get_module_by_id(id: str) -> Optional[Dict]:
-    cursor = await conn.execute("SELECT * FROM modules WHERE id = ?", (id,))
-    row = await cursor.fetchone()
-    await cursor.close()
-    return row
+    rows = await conn.execute_fetchall("SELECT * FROM modules WHERE id = ?", (id,))
+    return rows[0] if rows else None
 
 
 async def get_all_modules() -> Dict:
-    cursor = await conn.execute("SELECT * FROM modules")
-    rows = await cursor.fetchall()
-    await cursor.close()
+    rows = await conn.execute_fetchall("SELECT * FROM modules")
     return rows
 
 
+async def count_modules() -> int:
+    rows = await conn.execute_fetchall("SELECT COUNT(*) FROM modules")
+    return rows[0][0]
+
+
 async def create_module(
     id: str,
     url: str,
@@ -9,17 +9,15 @@ conn = database.get_conn()
 
 
 async def get_all_quickpic() -> Dict:
-    cursor = await conn.execute("SELECT * FROM quickpic")
-    rows = await cursor.fetchall()
-    await cursor.close()
+    rows = await conn.execute_fetchall("SELECT * FROM quickpic")
     return rows
 
 
 async def get_quickpic_by_branch(branch: str) -> Optional[Dict]:
-    cursor = await conn.execute("SELECT * FROM quickpic WHERE branch = ?", (branch,))
-    row = await cursor.fetchone()
-    await cursor.close()
-    return row
+    rows = await conn.execute_fetchall(
+        "SELECT * FROM quickpic WHERE branch = ?", (branch,)
+    )
+    return rows[0] if rows else None
 
 
 async def create_quickpic(
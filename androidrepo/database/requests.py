@@ -1,38 +1,32 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2021-2023 Hitalo M. <https://github.com/HitaloM>
 
-from typing import Dict, Optional
+from typing import Dict, List
 
 from .core import database
 
 conn = database.get_conn()
 
 
-async def get_request_by_user_id(user_id: int) -> Optional[Dict]:
-    cursor = await conn.execute("SELECT * FROM requests WHERE user = ?", (user_id,))
-    row = await cursor.fetchall()
-    await cursor.close()
-    return None if row is None else row
+async def get_request_by_user_id(user_id: int) -> List[Dict]:
+    rows = await conn.execute_fetchall(
+        "SELECT * FROM requests WHERE user = ?", (user_id,)
+    )
+    return rows
 
 
-async def get_request_by_message_id(message_id: int) -> Optional[Dict]:
-    cursor = await conn.execute(
+async def get_request_by_message_id(message_id: int) -> List[Dict]:
+    rows = await conn.execute_fetchall(
         "SELECT * FROM requests WHERE message_id = ?", (message_id,)
     )
-
-    row = await cursor.fetchall()
-    await cursor.close()
-    return None if row is None else row
+    return rows
 
 
-async def get_request_by_request_id(request_id: int) -> Optional[Dict]:
-    cursor = await conn.execute(
+async def get_request_by_request_id(request_id: int) -> List[Dict]:
+    rows = await conn.execute_fetchall(
         "SELECT * FROM requests WHERE request_id = ?", (request_id,)
     )
-
-    row = await cursor.fetchall()
-    await cursor.close()
-    return None if row is None else row
+    return rows
 
 
 async def create_request(
@@ -71,18 +65,11 @@ async def update_request(
     await conn.commit()
 
 
-async def update_request_from_dict(request: int, data: Dict):
+async def update_request_from_dict(user_id: int, request_id: int, data: Dict):
+    columns = ", ".join(f"{key} = ?" for key in data)
     await conn.execute(
-        "UPDATE requests SET time = ?, ignore = ?, request = ?, attempts = ?, request_id = ?, message_id = ? WHERE request_id = ?",
-        (
-            data["time"],
-            data["ignore"],
-            data["request"],
-            data["attempts"],
-            data["request_id"],
-            data["message_id"],
-            request,
-        ),
+        f"UPDATE requests SET {columns} WHERE user = ? AND request_id = ?",
+        (*data.values(), user_id, request_id),
     )
     if conn.total_changes <= 0:
         raise AssertionError
@@ -9,17 +9,15 @@ conn = database.get_conn()
 
 
 async def get_all_lsposed() -> Dict:
-    cursor = await conn.execute("SELECT * FROM lsposed")
-    rows = await cursor.fetchall()
-    await cursor.close()
+    rows = await conn.execute_fetchall("SELECT * FROM lsposed")
     return rows
 
 
 async def get_lsposed_by_branch(branch: str) -> Optional[Dict]:
-    cursor = await conn.execute("SELECT * FROM lsposed WHERE branch = ?", (branch,))
-    row = await cursor.fetchone()
-    await cursor.close()
-    return row
+    rows = await conn.execute_fetchall(
+        "SELECT * FROM lsposed WHERE branch = ?", (branch,)
+    )
+    return rows[0] if rows else None
 
 
 async def create_lsposed(
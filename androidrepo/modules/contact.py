@@ -5,24 +5,24 @@ from pyrogram import filters
 from pyrogram.types import Message
 
 from androidrepo.bot import AndroidRepo
-from androidrepo.config import PREFIXES, STAFF_ID
+from androidrepo.config import STAFF_ID
 from androidrepo.database.contact import (
+    contact_exists,
     create_contact,
     delete_contact,
-    get_contact_by_id,
 )
+from androidrepo.utils.filters import PREFIXES_TUPLE
 
 
 @AndroidRepo.on_message(filters.private & filters.cmd("contact"))
 async def on_contact_m(c: AndroidRepo, m: Message):
     user = m.from_user
-    contact = await get_contact_by_id(user_id=user.id)
-    if contact:
+    if await contact_exists(user_id=user.id):
         return await m.reply_text(
             "You are already in contact mode, you can start talking."
         )
     await create_contact(user_id=user.id)
-    await c.send_log_message(STAFF_ID, f"{user.mention} enter contact mode.")
+    c.send_log_message_nowait(STAFF_ID, f"{user.mention} enter contact mode.")
     return await m.reply_text(
         "You have successfully entered contact mode, everything you send here will be forwarded to the staff group."
     )
@@ -31,10 +31,8 @@ async def on_contact_m(c: AndroidRepo, m: Message):
 @AndroidRepo.on_message(filters.private & filters.cmd("quit"))
 async def on_quit_m(c: AndroidRepo, m: Message):
     user = m.from_user
-    contact = await get_contact_by_id(user_id=user.id)
-    if contact:
-        await delete_contact(user_id=contact["user"])
-        await c.send_log_message(STAFF_ID, f"{user.mention} left contact mode.")
+    if await delete_contact(user_id=user.id):
+        c.send_log_message_nowait(STAFF_ID, f"{user.mention} left contact mode.")
         return await m.reply_text(
             "You have successfully exited contact mode, I will no longer forward your messages."
         )
@@ -45,8 +43,10 @@ async def is_contact(_, __, m) -> bool:
     user = m.from_user
     if not user:
         return False
-    contact = await get_contact_by_id(user_id=user.id)
-    return False if contact is None else len(contact) > 0
+    # Commands are never forwarded, so don't hit the database for them
+    if m.text and m.text.startswith(PREFIXES_TUPLE):
+        return False
+    return await contact_exists(user_id=user.id)
 
 
 filters.is_contact = filters.create(is_contact, "IsContactFilter")
@@ -54,9 +54,6 @@ filters.is_contact = filters.create(is_contact, "IsContactFilter")
 
 @AndroidRepo.on_message(filters.private & filters.is_contact)
 async def on_message_m(c: AndroidRepo, m: Message):
-    for prefix in PREFIXES:
-        if m.text and m.text.startswith(prefix):
-            m.continue_propagation()
     await c.forward_messages(chat_id=STAFF_ID, from_chat_id=m.chat.id, message_ids=m.id)
 
 
@@ -68,12 +65,9 @@ async def reply_forwarded(_, __, m) -> bool:
 filters.reply_forwarded = filters.create(reply_forwarded, "ReplyForwardedFilter")
 
 
-@AndroidRepo.on_message(
-    filters.chat(STAFF_ID) & filters.reply & filters.reply_forwarded
-)
+@AndroidRepo.on_message(filters.staff & filters.reply & filters.reply_forwarded)
 async def on_answer_m(c: AndroidRepo, m: Message):
     reply = m.reply_to_message
     user = reply.forward_from
-    contact = await get_contact_by_id(user_id=user.id)
-    if len(contact) > 0:
+    if await contact_exists(user_id=user.id):
         await c.copy_message(chat_id=user.id, from_chat_id=m.chat.id, message_id=m.id)
@@ -3,7 +3,7 @@
 
 from typing import List
 
-import httpx
+import rapidjson as json
 from pyrogram import filters
 from pyrogram.enums import ParseMode
 from pyrogram.types import Message
@@ -12,19 +12,18 @@ from androidrepo.bot import AndroidRepo
 from androidrepo.database.magisk import create_magisk, get_magisk_by_branch
 from androidrepo.modules.utils import get_changelog
 from androidrepo.modules.utils.magisk import get_magisk, get_modules
+from androidrepo.utils import http
 
 TYPES: List[str] = ["beta", "stable", "canary"]
 
 
 @AndroidRepo.on_message(filters.cmd("magisk"))
 async def on_magisk_m(c: AndroidRepo, m: Message):
-    command = m.text.split()[0]
-    m_type = m.text[len(command) :]
+    args = m.text.split(maxsplit=1)
 
     sm = await m.reply("Checking...")
 
-    m_type = "stable" if len(m_type) < 1 else m_type[1:]
-    m_type = m_type.lower()
+    m_type = args[1].lower() if len(args) > 1 else "stable"
 
     if m_type not in TYPES:
         await sm.edit(f"The version type '<b>{m_type}</b>' was not found.")
@@ -32,25 +31,19 @@ async def on_magisk_m(c: AndroidRepo, m: Message):
 
     _magisk = await get_magisk_by_branch(branch=m_type)
     if _magisk is None:
-        async with httpx.AsyncClient(
-            http2=True, timeout=40, follow_redirects=True
-        ) as client:
-            r = await client.get(
-                f"https://github.com/topjohnwu/magisk-files/raw/master/{m_type}.json"
-            )
-            data = r.json()
-            await client.aclose()
-        magisk = data["magisk"]
-        changelog = await get_changelog(magisk["note"])
-        await create_magisk(
-            branch=m_type,
-            version=magisk["version"],
-            version_code=magisk["versionCode"],
-            link=magisk["link"],
-            note=magisk["note"],
-            changelog=changelog,
+        r = await http.get(
+            f"https://github.com/topjohnwu/magisk-files/raw/master/{m_type}.json"
         )
-        _magisk = await get_magisk_by_branch(branch=m_type)
+        data = json.loads(r.content)
+        magisk = data["magisk"]
+        _magisk = {
+            "version": magisk["version"],
+            "version_code": magisk["versionCode"],
+            "link": magisk["link"],
+            "note": magisk["note"],
+            "changelog": await get_changelog(magisk["note"]),
+        }
+        await create_magisk(branch=m_type, **_magisk)
 
     text = f"<b>Magisk Branch</b>: <code>{m_type}</code>"
     text += f"\n\n<b>Version</b>: <a href='{_magisk['link']}'>{'v' if _magisk['version'].isdecimal() else ''}{_magisk['version']}</a> ({_magisk['version_code']})"
@@ -1,14 +1,21 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2021-2023 Hitalo M. <https://github.com/HitaloM>
 
-from typing import Union
+import asyncio
+from typing import Dict, Union
 
-import httpx
-import xmltodict
 from pyrogram import filters
 from pyrogram.types import CallbackQuery, Message
 
 from androidrepo.bot import AndroidRepo
+from androidrepo.utils import http
+
+APPS: Dict[str, str] = {
+    "droidguard": "org.microg.gms.droidguard",
+    "gms": "com.google.android.gms",
+    "gsf": "com.google.android.gsf",
+    "vending": "com.android.vending",
+}
 
 
 @AndroidRepo.on_callback_query(filters.regex(r"^microg (\w+) (\d+)"))
@@ -20,18 +27,14 @@ async def on_microg(c: AndroidRepo, q: CallbackQuery):
         await q.answer("This button is not for you.", cache_time=60)
         return
 
-    if app == "droidguard":
-        app_id = "org.microg.gms.droidguard"
-    elif app == "gms":
-        app_id = "com.google.android.gms"
-    elif app == "gsf":
-        app_id = "com.google.android.gsf"
-    elif app == "vending":
-        app_id = "com.android.vending"
-
-    async with httpx.AsyncClient(http2=True) as client:
-        response = await client.get("https://microg.org/fdroid/repo/index.xml")
-        data = xmltodict.parse(response.text)
+    app_id = APPS.get(app)
+    if app_id is None:
+        return
+
+    import xmltodict
+
+    response = await http.get("https://microg.org/fdroid/repo/index.xml")
+    data = await asyncio.to_thread(xmltodict.parse, response.content)
 
     fdroid = data["fdroid"]
     for app in fdroid["application"]:
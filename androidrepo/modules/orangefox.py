@@ -4,7 +4,6 @@
 import time
 from typing import List
 
-import httpx
 import rapidjson as json
 from httpx import TimeoutException
 from pyrogram import filters
@@ -12,6 +11,7 @@ from pyrogram.enums import ChatType
 from pyrogram.types import Message
 
 from androidrepo.bot import AndroidRepo
+from androidrepo.utils import http
 
 API_HOST = "https://api.orangefox.download/v3"
 TYPES: List[str] = ["stable", "beta"]
@@ -30,20 +30,17 @@ async def orangefox_list(c: AndroidRepo, m: Message, build_type: str = None):
         args = m.text.split(" ")
         build_type = "stable" if len(args) == 1 else args[1]
     if m.chat.type == ChatType.PRIVATE:
-        async with httpx.AsyncClient(
-            http2=True, timeout=40, follow_redirects=True
-        ) as client:
-            text = f"<b>OrangeFox Recovery <i>{build_type}</i> is currently avaible for:</b>"
-            data = await client.get(
-                f"{API_HOST}/devices/?release_type={build_type}&sort=device_name_asc"
-            )
-            devices = json.loads(data.text)
-            for device in devices["data"]:
-                text += (
-                    f"\n - {device['full_name']} (<code>{device['codename']}</code>)"
-                )
+        text = (
+            f"<b>OrangeFox Recovery <i>{build_type}</i> is currently avaible for:</b>"
+        )
+        data = await http.get(
+            f"{API_HOST}/devices/?release_type={build_type}&sort=device_name_asc"
+        )
+        devices = json.loads(data.content)
+        for device in devices["data"]:
+            text += f"\n - {device['full_name']} (<code>{device['codename']}</code>)"
 
-            await m.reply_text(text)
+        await m.reply_text(text)
     else:
         text = f"Click the button below to receive the list of devices with <code>{build_type}</code> releases of OrangeFox."
         text += "\nUse <code>/ofox (device)</code> or <code>/ofox (device) beta</code> to get the last release for the specified device."
@@ -75,61 +72,56 @@ async def orangefox(c: AndroidRepo, m: Message):
         await m.reply_text("Too many arguments! See <code>/help</code>.")
         return
 
-    async with httpx.AsyncClient(
-        http2=True, timeout=40, follow_redirects=True
-    ) as client:
-        try:
-            data = await client.get(f"{API_HOST}/devices/get?codename={codename}")
-        except TimeoutException:
-            await m.reply_text("Sorry, I couldn't connect to the OranegFox API!")
-            return
-        if data.status_code == 404:
-            await m.reply_text("Couldn't find any results matching your query.")
-            return
-        device = json.loads(data.text)
-        data = await client.get(
-            f"{API_HOST}/releases/?codename={codename}&type={build_type}&sort=date_desc&limit=1"
+    if build_type not in TYPES:
+        await m.reply_text(
+            f"⚠️ There is no type '<b>{build_type}</b>', there is only beta and stable."
         )
+        return
 
-        if data.status_code == 404 and build_type in TYPES:
-            url = f"https://orangefox.download/device/{device['codename']}"
-            keyboard = [[("Device's page", url, "url")]]
-            await m.reply_text(
-                f"⚠️ There is no '<b>{build_type}</b>' releases for <b>{device['full_name']}</b>.",
-                reply_markup=c.ikb(keyboard),
-            )
-
-            return
-        if build_type not in TYPES:
-            await m.reply_text(
-                f"⚠️ There is no type '<b>{build_type}</b>', there is only beta and stable."
-            )
-
-            return
-        find_id = json.loads(data.text)
-        for build in find_id["data"]:
-            file_id = build["_id"]
-        data = await client.get(f"{API_HOST}/releases/get?_id={file_id}")
-        release = json.loads(data.text)
-        if data.status_code == 404:
-            await m.reply_text("Couldn't find any results matching your query.")
-            return
-        text = f"<u><b>OrangeFox Recovery <i>{build_type}</i> release</b></u>\n"
-        text += f"  <b>Device:</b> {device['full_name']} (<code>{device['codename']}</code>)\n"
-
-        text += f"  <b>Version:</b> {release['version']}\n"
-        of_release_date = time.strftime("%d/%m/%Y", time.localtime(release["date"]))
-        text += f"  <b>Release date:</b> {of_release_date}\n"
-        text += f"  <b>Maintainer:</b> {device['maintainer']['name']}\n"
-        changelog = release["changelog"]
-        text += "  <u><b>Changelog:</b></u>\n"
-        for entry_num in range(len(changelog)):
-            if entry_num == 10:
-                break
-            text += f"    - {changelog[entry_num]}\n"
-        mirror = release["mirrors"]["US"]
-        url = mirror if mirror is not None else release["url"]
-        keyboard = [[("⬇️ Download", url, "url")]]
+    try:
+        data = await http.get(f"{API_HOST}/devices/get?codename={codename}")
+    except TimeoutException:
+        await m.reply_text("Sorry, I couldn't connect to the OranegFox API!")
+        return
+    if data.status_code == 404:
+        await m.reply_text("Couldn't find any results matching your query.")
+        return
+    device = json.loads(data.content)
+    data = await http.get(
+        f"{API_HOST}/releases/?codename={codename}&type={build_type}&sort=date_desc&limit=1"
+    )
+
+    if data.status_code == 404:
+        url = f"https://orangefox.download/device/{device['codename']}"
+        keyboard = [[("Device's page", url, "url")]]
         await m.reply_text(
-            text, reply_markup=c.ikb(keyboard), disable_web_page_preview=True
+            f"⚠️ There is no '<b>{build_type}</b>' releases for <b>{device['full_name']}</b>.",
+            reply_markup=c.ikb(keyboard),
         )
+
+        return
+    find_id = json.loads(data.content)
+    for build in find_id["data"]:
+        file_id = build["_id"]
+    data = await http.get(f"{API_HOST}/releases/get?_id={file_id}")
+    release = json.loads(data.content)
+    if data.status_code == 404:
+        await m.reply_text("Couldn't find any results matching your query.")
+        return
+    text = f"<u><b>OrangeFox Recovery <i>{build_type}</i> release</b></u>\n"
+    text += (
+        f"  <b>Device:</b> {device['full_name']} (<code>{device['codename']}</code>)\n"
+    )
+
+    text += f"  <b>Version:</b> {release['version']}\n"
+    of_release_date = time.strftime("%d/%m/%Y", time.localtime(release["date"]))
+    text += f"  <b>Release date:</b> {of_release_date}\n"
+    text += f"  <b>Maintainer:</b> {device['maintainer']['name']}\n"
+    text += "  <u><b>Changelog:</b></u>\n"
+    text += "".join(f"    - {entry}\n" for entry in release["changelog"][:10])
+    mirror = release["mirrors"]["US"]
+    url = mirror if mirror is not None else release["url"]
+    keyboard = [[("⬇️ Download", url, "url")]]
+    await m.reply_text(
+        text, reply_markup=c.ikb(keyboard), disable_web_page_preview=True
+    )
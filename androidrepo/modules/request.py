@@ -2,15 +2,14 @@
 # Copyright (c) 2021-2023 Hitalo M. <https://github.com/HitaloM>
 
 import asyncio
-import datetime
 import time
 from contextlib import suppress
-from typing import List
+from typing import List, Optional
 
 from kantex.html import Bold, Code, Italic, Item, KanTeXDocument, KeyValueItem, Section
 from pyrogram import filters
 from pyrogram.enums import ChatType
-from pyrogram.errors import BadRequest, UserIsBlocked
+from pyrogram.errors import BadRequest, Forbidden, UserIsBlocked
 from pyrogram.types import Message, User
 
 from androidrepo.bot import AndroidRepo
@@ -21,10 +20,32 @@ from androidrepo.database.requests import (
     get_request_by_message_id,
     get_request_by_request_id,
     get_request_by_user_id,
-    update_request,
     update_request_from_dict,
 )
 
+# Static KanTeX keys shared by every request document
+ID_KEY = Bold("ID")
+FROM_KEY = Bold("From")
+REQUEST_KEY = Bold("Request")
+ANSWER_KEY = Bold("Answer")
+IGNORED_KEY = Bold("Ignored")
+STAFF_MESSAGE_KEY = Bold("Staff message")
+
+DONE_NOTE = Section(
+    "Note",
+    Italic("Don't be surprised, it will disappear from your request list."),
+)
+
+
+async def delete_later(c: AndroidRepo, chat_id: int, message_ids: List[int]):
+    await asyncio.sleep(5)
+    try:
+        await c.delete_messages(chat_id, message_ids)
+    except (BadRequest, Forbidden):
+        for message_id in message_ids:
+            with suppress(BadRequest, Forbidden):
+                await c.delete_messages(chat_id, message_id)
+
 
 @AndroidRepo.on_message((filters.cmd("request ") | filters.regex("^#request ")))
 async def on_request_m(c: AndroidRepo, m: Message):
@@ -42,10 +63,7 @@ async def on_request_m(c: AndroidRepo, m: Message):
             "Please use this command in private.",
             reply_markup=c.ikb(keyboard),
         )
-        await asyncio.sleep(5)
-        with suppress(BadRequest):
-            await sent.delete()
-            await m.delete()
+        c.create_background_task(delete_later(c, m.chat.id, [sent.id, m.id]))
         return
     user = m.from_user
     requests = await get_request_by_user_id(user_id=user.id)
@@ -59,27 +77,29 @@ async def on_request_m(c: AndroidRepo, m: Message):
     now_time = time.time()
 
     if user.id not in SUDO_USERS:
-        now = datetime.datetime.fromtimestamp(now_time)
         if last_request_time > 0:
-            last = datetime.datetime.fromtimestamp(last_request_time)
             if last_request["attempts"] > 3:
                 if bool(last_request["ignore"]):
                     return
-                await update_request(Ignore=1)
-                await c.send_log_message(
+                await update_request_from_dict(
+                    user_id=user.id,
+                    request_id=last_request["request_id"],
+                    data={"ignore": 1},
+                )
+                c.send_log_message_nowait(
                     STAFF_ID,
                     f"{user.mention} was spamming requests and has been ignored.",
                 )
                 return await m.reply_text(
                     "You have spammed too many requests, so you will be ignored."
                 )
-            if (now - last).seconds < (3 * 60):
+            if (now_time - last_request_time) < (3 * 60):
                 await update_request_from_dict(
-                    request=last_request,
-                    data={"attempts": (last_request.attempts) + 1},
+                    user_id=user.id,
+                    request_id=last_request["request_id"],
+                    data={"attempts": last_request["attempts"] + 1},
                 )
-                await last_request.save()
-                await c.send_log_message(
+                c.send_log_message_nowait(
                     STAFF_ID, f"{user.mention} is spamming requests."
                 )
                 return await m.reply_text(
@@ -89,12 +109,12 @@ async def on_request_m(c: AndroidRepo, m: Message):
     if requests is not None and len(requests) > 15:
         return await m.reply_text("You have reached the requests limit.")
 
-    request = m.text[len(m.text.split()[0]) + 1 :]
+    request = m.text.partition(" ")[2]
     doc = KanTeXDocument(
         Section(
             "New request",
-            KeyValueItem(Bold("From"), (user.mention)),
-            KeyValueItem(Bold("Request"), Code(request)),
+            KeyValueItem(FROM_KEY, (user.mention)),
+            KeyValueItem(REQUEST_KEY, Code(request)),
         )
     )
     sent = await c.send_log_message(STAFF_ID, doc)
@@ -120,7 +140,7 @@ async def on_myrequests_m(c: AndroidRepo, m: Message):
 
     if requests:
         doc = KanTeXDocument(
-            KeyValueItem(Bold("Ignored"), Code(bool(requests[0]["ignore"]))),
+            KeyValueItem(IGNORED_KEY, Code(bool(requests[0]["ignore"]))),
         )
         sec = Section("Requests")
         for request in requests:
@@ -142,30 +162,34 @@ async def on_cancelrequest_m(c: AndroidRepo, m: Message):
     request = await get_request_by_request_id(request_id=rid)
 
     if request:
-        await c.delete_log_messages(message_ids=request[0]["message_id"])
-        await delete_request(user_id=user.id, request_id=rid)
+        await asyncio.gather(
+            c.delete_log_messages(message_ids=request[0]["message_id"]),
+            delete_request(user_id=user.id, request_id=rid),
+        )
         return await m.reply_text("Request canceled successfully!")
     return await m.reply_text("Request not found.")
 
 
-@AndroidRepo.on_message((filters.chat(STAFF_ID) | filters.sudo) & filters.cmd("ignore"))
-async def on_ignore_m(c: AndroidRepo, m: Message):
+async def get_target_user(c: AndroidRepo, m: Message) -> Optional[User]:
     if reply := m.reply_to_message:
-        user = reply.from_user
-    else:
-        text_splited = m.text.split()
-        if len(text_splited) > 1:
-            user = text_splited[1]
-        elif not text_splited:
-            return await m.reply_text("Specify someone.")
+        return reply.from_user
+
+    args = m.text.split()
+    if len(args) < 2:
+        await m.reply_text("Specify someone.")
+        return None
+
+    try:
+        return await c.get_users(args[1])
+    except (BadRequest, IndexError):
+        await m.reply_text("This user was not found.")
+        return None
 
-    if not isinstance(user, User):
-        try:
-            user = await c.get_users(user)
-        except BaseException:
-            return await m.reply_text("This user was not found.")
 
-    if user.id in SUDO_USERS:
+@AndroidRepo.on_message((filters.staff | filters.sudo) & filters.cmd("ignore"))
+async def on_ignore_m(c: AndroidRepo, m: Message):
+    user = await get_target_user(c, m)
+    if user is None or user.id in SUDO_USERS:
         return
 
     requests = await get_request_by_user_id(user_id=user.id)
@@ -177,51 +201,37 @@ async def on_ignore_m(c: AndroidRepo, m: Message):
         )
         return await m.reply_text(f"{user.mention} can't send requests.")
 
-    if not bool(last_request.ignore):
+    if not bool(last_request["ignore"]):
         await update_request_from_dict(
-            request=last_request,
+            user_id=user.id,
+            request_id=last_request["request_id"],
             data={"ignore": 1},
         )
-        await last_request.save()
         return await m.reply_text(f"{user.mention} is prevented from sending requests.")
     return await m.reply_text(f"{user.mention} is already ignored.")
 
 
-@AndroidRepo.on_message(
-    (filters.chat(STAFF_ID) | filters.sudo) & filters.cmd("unignore")
-)
+@AndroidRepo.on_message((filters.staff | filters.sudo) & filters.cmd("unignore"))
 async def on_unignore_m(c: AndroidRepo, m: Message):
-    if reply := m.reply_to_message:
-        user = reply.from_user
-    else:
-        text_splited = m.text.split()
-        if len(text_splited) > 1:
-            user = text_splited[1]
-        elif not text_splited:
-            return await m.reply_text("Specify someone.")
-    if not isinstance(user, User):
-        try:
-            user = await c.get_users(user)
-        except BaseException:
-            return await m.reply_text("This user was not found.")
-    if user.id in SUDO_USERS:
+    user = await get_target_user(c, m)
+    if user is None or user.id in SUDO_USERS:
         return
     requests = await get_request_by_user_id(user_id=user.id)
     if requests:
         last_request = requests[-1]
     else:
         return await m.reply_text(f"{user.mention} is not ignored.")
-    if bool(last_request.ignore):
+    if bool(last_request["ignore"]):
         await update_request_from_dict(
-            request=last_request, data={"attempts": 0, "ignore": 0}
+            user_id=user.id,
+            request_id=last_request["request_id"],
+            data={"attempts": 0, "ignore": 0},
         )
-
-        await last_request.save()
         return await m.reply_text(f"{user.mention} can send requests again.")
     return await m.reply_text(f"{user.mention} is not ignored.")
 
 
-@AndroidRepo.on_message(filters.chat(STAFF_ID) & filters.cmd("done") & filters.reply)
+@AndroidRepo.on_message(filters.staff & filters.cmd("done") & filters.reply)
 async def on_done_m(c: AndroidRepo, m: Message):
     query = m.text.split()
     command = query[0]
@@ -238,14 +248,11 @@ async def on_done_m(c: AndroidRepo, m: Message):
         doc = KanTeXDocument(
             Section(
                 "Request done",
-                KeyValueItem(Bold("ID"), Code(request_id)),
-                KeyValueItem(Bold("Staff message"), Code(staff_msg)),
-                KeyValueItem(Bold("Request"), Code(request["request"])),
-            ),
-            Section(
-                "Note",
-                Italic("Don't be surprised, it will disappear from your request list."),
+                KeyValueItem(ID_KEY, Code(request_id)),
+                KeyValueItem(STAFF_MESSAGE_KEY, Code(staff_msg)),
+                KeyValueItem(REQUEST_KEY, Code(request["request"])),
             ),
+            DONE_NOTE,
         )
 
         with suppress(UserIsBlocked):
@@ -256,7 +263,7 @@ async def on_done_m(c: AndroidRepo, m: Message):
 
 
 @AndroidRepo.on_message(
-    filters.chat(STAFF_ID) & filters.reply & filters.regex("^(?P<answer>.+)")
+    filters.staff & filters.reply & filters.regex("^(?P<answer>.+)")
 )
 async def on_reply_m(c: AndroidRepo, m: Message):
     answer = m.matches[0]["answer"]
@@ -268,8 +275,8 @@ async def on_reply_m(c: AndroidRepo, m: Message):
         doc = KanTeXDocument(
             Section(
                 "Answer to your request",
-                KeyValueItem(Bold("ID"), Code(request_id)),
-                KeyValueItem(Bold("Answer"), Code(answer)),
+                KeyValueItem(ID_KEY, Code(request_id)),
+                KeyValueItem(ANSWER_KEY, Code(answer)),
             )
         )
         try:
@@ -281,19 +288,22 @@ async def on_reply_m(c: AndroidRepo, m: Message):
         m.continue_propagation()
 
 
-@AndroidRepo.on_deleted_messages(filters.chat(STAFF_ID))
-async def on_deleted_m(c: AndroidRepo, messages: List[Message]):
-    for m in messages:
-        request = await get_request_by_message_id(message_id=m.id)
-        if request:
-            user_id = request[0]["user"]
-            request_id = request[0]["request_id"]
-            doc = KanTeXDocument(
-                Section(
-                    "Request canceled",
-                    KeyValueItem(Bold("ID"), Code(request_id)),
-                    KeyValueItem(Bold("Request"), Code(request[0]["request"])),
-                )
+async def cancel_deleted_request(c: AndroidRepo, m: Message):
+    request = await get_request_by_message_id(message_id=m.id)
+    if request:
+        user_id = request[0]["user"]
+        request_id = request[0]["request_id"]
+        doc = KanTeXDocument(
+            Section(
+                "Request canceled",
+                KeyValueItem(ID_KEY, Code(request_id)),
+                KeyValueItem(REQUEST_KEY, Code(request[0]["request"])),
             )
-            await c.send_message(chat_id=user_id, text=doc)
-            await delete_request(user_id=user_id, request_id=request_id)
+        )
+        await c.send_message(chat_id=user_id, text=doc)
+        await delete_request(user_id=user_id, request_id=request_id)
+
+
+@AndroidRepo.on_deleted_messages(filters.staff)
+async def on_deleted_m(c: AndroidRepo, messages: List[Message]):
+    await asyncio.gather(*(cancel_deleted_request(c, m) for m in messages))
@@ -19,13 +19,26 @@ from androidrepo.bot import AndroidRepo
 from androidrepo.config import LOGS_ID
 
 DOWNLOAD_DIR = "./downloads/"
+URL_PATTERN = re.compile(r"(http(s)?)?(://)?(www)?(\.)?(.*)\.(.*)")
+
+
+async def edit_progress(m: Message, sent: Message, text: str) -> Message:
+    try:
+        await sent.edit(text)
+    except FloodWait as e:
+        await asyncio.sleep(e.x)
+    except MessageIdInvalid:
+        sent = await m.reply_text(text)
+    except MessageNotModified:
+        pass
+    return sent
 
 
 @AndroidRepo.on_message(filters.sudo & filters.cmd(r"reup (?P<query>.+)"))
 async def reupload(c: AndroidRepo, m: Message):
     file_url = m.matches[0]["query"]
 
-    is_url = re.match(r"(http(s)?)?(://)?(www)?(\.)?(.*)\.(.*)", file_url)
+    is_url = URL_PATTERN.match(file_url)
     if not is_url:
         await m.reply_text("<b>Error:</b> Enter a valid URL.")
         return
@@ -70,38 +83,26 @@ async def reupload(c: AndroidRepo, m: Message):
                 )
                 text += f"\n<b>ETA</b>: {download.get_eta(human=True, precise=True)}"
                 text += f"\n<b>Progress</b>: {download.get_progress()}%"
-                try:
-                    await sent.edit(text)
-                except FloodWait as e:
-                    await asyncio.sleep(e.x)
-                except MessageIdInvalid:
-                    sent = await m.reply_text(text)
-                except MessageNotModified:
-                    pass
+                sent = await edit_progress(m, sent, text)
                 last_update = datetime.now()
+            await asyncio.sleep(0.5)
 
     last_edit = 0
 
     async def progress(current: float, total: float):
         nonlocal last_edit
         nonlocal sent
-        percent = int(f"{current / total * 100:.0f}")
+        if last_edit + 1 >= int(time.time()) and current != total:
+            return
 
+        percent = round(current / total * 100)
         text = "<b>Uploading...</b>\n"
         text += f"\n<b>File name</b>: <code>{file_name}</code>"
         text += f"\n<b>Size</b>: {humanize.naturalsize(current)}/{humanize.naturalsize(total)}"
         text += f"\n<b>Elapsed</b>: {humanize.precisedelta(datetime.now() - start)}"
         text += f"\n<b>Progress</b>: {percent}%"
-        if last_edit + 1 < int(time.time()) or current == total:
-            try:
-                await sent.edit(text)
-            except FloodWait as e:
-                await asyncio.sleep(e.x)
-            except MessageIdInvalid:
-                sent = await m.reply_text(text)
-            except MessageNotModified:
-                pass
-            last_edit = int(time.time())
+        sent = await edit_progress(m, sent, text)
+        last_edit = int(time.time())
 
     await c.send_channel_document(
         caption=file_desc.text.markdown,
@@ -119,7 +120,7 @@ async def reupload(c: AndroidRepo, m: Message):
     )
     os.remove(file_path)
 
-    await c.send_log_message(
+    c.send_log_message_nowait(
         LOGS_ID,
         (
             "<b>New re-upload</b>\n"
@@ -21,7 +21,7 @@ from pyrogram.types import CallbackQuery, Message
 import androidrepo
 from androidrepo.bot import AndroidRepo
 from androidrepo.config import OWNER_ID
-from androidrepo.database.magisk import get_all_modules
+from androidrepo.database.magisk import count_modules
 
 
 @AndroidRepo.on_message(filters.sudo & filters.cmd("ping"))
@@ -118,8 +118,7 @@ async def on_shutdown_m(c: AndroidRepo, m: Message):
 
 @AndroidRepo.on_message(filters.cmd("(sh(eel)?|term(inal)?) ") & filters.user(OWNER_ID))
 async def on_terminal_m(c: AndroidRepo, m: Message):
-    command = m.text.split()[0]
-    code = m.text[len(command) + 1 :]
+    code = m.text.partition(" ")[2]
     sm = await m.reply_text("Running...")
     proc = await asyncio.create_subprocess_shell(
         code,
@@ -132,9 +131,7 @@ async def on_terminal_m(c: AndroidRepo, m: Message):
     output_message = f"<b>Input\n&gt;</b> <code>{code}</code>\n\n"
     if output != "":
         if len(output) > (4096 - len(output_message)):
-            document = io.BytesIO(
-                (output.replace("<code>", "").replace("</code>", "")).encode()
-            )
+            document = io.BytesIO(stdout)
             document.name = "output.txt"
             await c.send_document(
                 chat_id=m.chat.id, document=document, reply_to_message_id=m.id
@@ -146,8 +143,7 @@ async def on_terminal_m(c: AndroidRepo, m: Message):
 
 @AndroidRepo.on_message(filters.sudo & filters.cmd("ev(al)? "))
 async def on_eval_m(c: AndroidRepo, m: Message):
-    command = m.text.split()[0]
-    eval_code = m.text[len(command) + 1 :]
+    eval_code = m.text.partition(" ")[2]
     sm = await m.reply_text("Running...")
     try:
         stdout = await meval(eval_code, globals(), **locals())
@@ -162,9 +158,7 @@ async def on_eval_m(c: AndroidRepo, m: Message):
     output_message = f"<b>Input\n&gt;</b> <code>{eval_code}</code>\n\n"
     if len(output) > 0:
         if len(output) > (4096 - len(output_message)):
-            document = io.BytesIO(
-                (output.replace("<code>", "").replace("</code>", "")).encode()
-            )
+            document = io.BytesIO(str(stdout).encode())
             document.name = "output.txt"
             await c.send_document(
                 chat_id=m.chat.id, document=document, reply_to_message_id=m.id
@@ -176,8 +170,7 @@ async def on_eval_m(c: AndroidRepo, m: Message):
 
 @AndroidRepo.on_message(filters.sudo & filters.cmd("ex(ec(ute)?)? "))
 async def on_execute_m(c: AndroidRepo, m: Message):
-    command = m.text.split()[0]
-    code = m.text[len(command) + 1 :]
+    code = m.text.partition(" ")[2]
     sm = await m.reply_text("Running...")
     function = """
 async def _aexec_(c: AndroidRepo, m: Message):
@@ -199,7 +192,7 @@ async def _aexec_(c: AndroidRepo, m: Message):
 
 @AndroidRepo.on_message(filters.sudo & filters.cmd("py"))
 async def on_info_m(c: AndroidRepo, m: Message):
-    magisk_modules = await get_all_modules()
+    magisk_modules = await count_modules()
     source_url = "git.io/JtVsY"
     doc = KanTeXDocument(
         Section(
@@ -213,9 +206,7 @@ async def on_info_m(c: AndroidRepo, m: Message):
                 KeyValueItem(Bold("Source"), source_url),
                 KeyValueItem(Bold("System"), c.system_version),
             ),
-            SubSection(
-                "Magisk", KeyValueItem(Bold("Modules"), Code(len(magisk_modules)))
-            ),
+            SubSection("Magisk", KeyValueItem(Bold("Modules"), Code(magisk_modules))),
         )
     )
     await m.reply_text(doc, disable_web_page_preview=True)
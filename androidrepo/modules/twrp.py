@@ -1,20 +1,18 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2021-2023 Hitalo M. <https://github.com/HitaloM>
 
-import httpx
-from bs4 import BeautifulSoup
 from pyrogram import filters
 from pyrogram.types import Message
 
 from androidrepo.bot import AndroidRepo
+from androidrepo.utils import http
 
 
 @AndroidRepo.on_message(filters.cmd("twrp"))
 async def twrp(c: AndroidRepo, m: Message):
-    command = m.text.split()[0]
-    device = m.text[len(command) :]
+    args = m.text.split(maxsplit=1)
 
-    if len(device) < 1:
+    if len(args) < 2:
         await m.reply_text(
             text=(
                 "<b>Usage</b>: <code>/twrp (codename)</code>."
@@ -23,17 +21,15 @@ async def twrp(c: AndroidRepo, m: Message):
         )
         return
 
-    if len(device) > 1:
-        device = device[1:]
-
-    async with httpx.AsyncClient(
-        http2=True, timeout=40, follow_redirects=True
-    ) as client:
-        r = await client.get(f"https://eu.dl.twrp.me/{device}/")
-        if r.status_code == 404:
-            text = f"Couldn't find twrp downloads for <code>{device}</code>!"
-            await m.reply_text(text)
-            return
+    device = args[1]
+
+    r = await http.get(f"https://eu.dl.twrp.me/{device}/")
+    if r.status_code == 404:
+        text = f"Couldn't find twrp downloads for <code>{device}</code>!"
+        await m.reply_text(text)
+        return
+
+    from bs4 import BeautifulSoup
 
     page = BeautifulSoup(r.content, "lxml")
     date = page.find("em").text.strip()
@@ -2,28 +2,32 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2021-2023 Hitalo M. <https://github.com/HitaloM>
 
-import httpx
+from datetime import datetime
+from typing import List
+
+from androidrepo.utils import http
+
+
+def get_date() -> str:
+    return datetime.now().strftime("%H:%M:%S - %d/%m/%Y")
 
 
 async def get_changelog(url: str) -> str:
-    changelog = ""
-    async with httpx.AsyncClient(
-        http2=True, timeout=40, follow_redirects=True
-    ) as client:
-        response = await client.get(url)
-        data = response.read()
-        if "Page not found" in data.decode():
-            return "Changelog not found."
-        lines = data.decode().split("\n")
-        latest_version = False
-        for line in lines:
-            if len(line) < 1:
-                continue
-            if line.startswith("##"):
-                if not latest_version:
-                    latest_version = True
-                else:
-                    break
+    changelog: List[str] = []
+    response = await http.get(url)
+    data = response.text
+    if "Page not found" in data:
+        return "Changelog not found."
+    lines = data.split("\n")
+    latest_version = False
+    for line in lines:
+        if len(line) < 1:
+            continue
+        if line.startswith("##"):
+            if not latest_version:
+                latest_version = True
             else:
-                changelog += f"\n{line}"
-    return changelog
+                break
+        else:
+            changelog.append(f"\n{line}")
+    return "".join(changelog)
@@ -2,19 +2,19 @@
 # Copyright (c) 2021-2023 Hitalo M. <https://github.com/HitaloM>
 
 import asyncio
-import contextlib
 import io
 import os
 import shutil
-from datetime import datetime
+from contextlib import suppress
+from functools import lru_cache
 from typing import Dict, List
 from zipfile import ZipFile
 
 import aiodown
-import httpx
 import rapidjson as json
 from github import Github
 from github.GithubException import UnknownObjectException
+from github.NamedUser import NamedUser
 from pyrogram import Client
 from pyrogram.enums import ParseMode
 from pyrogram.types import Message
@@ -27,26 +27,29 @@ from androidrepo.database.magisk import (
     get_all_magisk,
     get_all_modules,
     get_magisk_by_branch,
-    get_module_by_id,
     update_magisk_from_dict,
     update_module_by_dict,
 )
-from androidrepo.modules.utils import get_changelog
+from androidrepo.modules.utils import get_changelog, get_date
+from androidrepo.utils import http
 
 DOWNLOAD_DIR: str = "./downloads/"
 MAGISK_URL: str = "https://github.com/topjohnwu/magisk-files/raw/master/{}.json"
+TYPES: List[str] = ["stable", "beta", "canary"]
 
-github = Github(config.GITHUB_TOKEN)
-user = github.get_user("Magisk-Modules-Repo")
-repos = user.get_repos()
+
+@lru_cache(maxsize=1)
+def get_modules_owner() -> NamedUser:
+    github = Github(config.GITHUB_TOKEN)
+    return github.get_user("Magisk-Modules-Repo")
 
 
 async def check_modules(c: Client):
-    date = datetime.now().strftime("%H:%M:%S - %d/%m/%Y")
     modules = {"list": []}
     updated_modules = []
     excluded_modules = []
-    for repo in repos:
+    known_modules = {module["id"]: module for module in await get_all_modules()}
+    for repo in get_modules_owner().get_repos():
         try:
             module_prop = repo.get_contents("module.prop").decoded_content.decode(
                 "utf-8"
@@ -60,7 +63,7 @@ async def check_modules(c: Client):
             commit_date = commit.commit.committer.date
             module["last_update"] = int(commit_date.timestamp() * 1000)
             modules["list"].append(module)
-            _module = await get_module_by_id(id=module["id"])
+            _module = known_modules.get(module["id"])
             if not _module:
                 await create_module(
                     id=module["id"],
@@ -81,13 +84,10 @@ async def check_modules(c: Client):
             await asyncio.sleep(2)
             await update_module(c, module)
 
-    module_ids = list(map(lambda module: module["id"], modules["list"]))
-    for _module in await get_all_modules():
+    module_ids = {module["id"] for module in modules["list"]}
+    for _module in known_modules.values():
         if _module["id"] not in module_ids:
             excluded_modules.append(_module)
-            for index, module in enumerate(modules["list"]):
-                if _module["id"] == module["id"]:
-                    del modules["list"][index]
             await delete_module(id=_module["id"])
     if updated_modules or excluded_modules:
         await c.send_log_message(
@@ -98,7 +98,7 @@ async def check_modules(c: Client):
     <b>Updated</b>: <code>{len(updated_modules)}</code>
     <b>Excluded</b>: <code>{len(excluded_modules)}</code>
 
-<b>Date</b>: <code>{date}</code>
+<b>Date</b>: <code>{get_date()}</code>
 #Sync #Magisk #Modules
     """,
         )
@@ -106,7 +106,7 @@ async def check_modules(c: Client):
 
 
 async def get_modules(m: Message):
-    date = datetime.now().strftime("%H:%M:%S - %d/%m/%Y")
+    date = get_date()
     modules = await get_all_modules()
     modules_list = []
     if len(modules) > 0:
@@ -133,7 +133,7 @@ async def get_modules(m: Message):
 
 
 async def get_magisk(m: Message):
-    date = datetime.now().strftime("%H:%M:%S - %d/%m/%Y")
+    date = get_date()
     magisks = await get_all_magisk()
     magisks_list = []
     if len(magisks) > 0:
@@ -162,55 +162,21 @@ async def get_magisk(m: Message):
 async def parse_module(data: str) -> Dict:
     module: Dict = {}
     for line in data.splitlines():
-        try:
-            key, value = line.split("=", 1)
-            if key in [
-                "id",
-                "author",
-                "description",
-                "name",
-                "version",
-                "versionCode",
-                "updateJson",
-            ]:
-                module[key] = value
-        except BaseException:
-            continue
+        key, sep, value = line.partition("=")
+        if sep and key in {
+            "id",
+            "author",
+            "description",
+            "name",
+            "version",
+            "versionCode",
+            "updateJson",
+        }:
+            module[key] = value
     return module
 
 
-async def update_module(c: Client, module: Dict):
-    file_name = (
-        (
-            (
-                (
-                    (
-                        (
-                            module["name"]
-                            .replace("-", "")
-                            .replace(" ", "-")
-                            .replace("--", "")
-                            + "_"
-                        )
-                        + module["version"]
-                    )
-                    + "_"
-                )
-                + "("
-            )
-            + module["versionCode"]
-        )
-        + ")"
-    ) + ".zip"
-
-    file_path = DOWNLOAD_DIR + file_name
-    async with aiodown.Client() as client:
-        download = client.add(module["url"], file_path)
-        await client.start()
-        while not download.is_finished():
-            await asyncio.sleep(0.5)
-        if download.get_status() == "failed":
-            return
+def repack_module(file_path: str):
     files = []
     extraction_path = None
     with ZipFile(file_path, "r") as old_zip:
@@ -225,11 +191,25 @@ async def update_module(c: Client, module: Dict):
     with ZipFile(file_path, "w") as new_zip:
         for file in files:
             name = "/".join(file.split("/")[3:])
-            if name not in [" ", ""] and not name.startswith("."):
+            if name not in {" ", ""} and not name.startswith("."):
                 new_zip.write(file, name)
         new_zip.close()
-    with contextlib.suppress(BaseException):
-        shutil.rmtree(extraction_path)
+    shutil.rmtree(extraction_path, ignore_errors=True)
+
+
+async def update_module(c: Client, module: Dict):
+    name = module["name"].replace("-", "").replace(" ", "-").replace("--", "")
+    file_name = f"{name}_{module['version']}_({module['versionCode']}).zip"
+
+    file_path = DOWNLOAD_DIR + file_name
+    async with aiodown.Client() as client:
+        download = client.add(module["url"], file_path)
+        await client.start()
+        while not download.is_finished():
+            await asyncio.sleep(0.5)
+        if download.get_status() == "failed":
+            return
+    await asyncio.to_thread(repack_module, file_path)
     caption = f"""
 <b>{module["name"]} {"v" if module["version"][0].isdecimal() else ""}{module["version"]} ({module["versionCode"]})</b>
 
@@ -259,68 +239,64 @@ async def update_module(c: Client, module: Dict):
 
 
 async def check_magisk(c: Client):
-    TYPES: List[str] = ["stable", "beta", "canary"]
     for magisk in TYPES:
         await update_magisk(c, magisk)
 
 
 async def update_magisk(c: Client, m_type: str):
-    date = datetime.now().strftime("%H:%M:%S - %d/%m/%Y")
     URL = MAGISK_URL.format(m_type)
-    async with httpx.AsyncClient(
-        http2=True, timeout=40, follow_redirects=True
-    ) as client:
-        response = await client.get(URL)
-        data = response.json()
-        magisk = data["magisk"]
-        _magisk = await get_magisk_by_branch(branch=m_type)
-        if _magisk is None:
+    response = await http.get(URL)
+    data = json.loads(response.content)
+    magisk = data["magisk"]
+    _magisk = await get_magisk_by_branch(branch=m_type)
+    if _magisk is None:
+        chg = await get_changelog(magisk["note"])
+        await create_magisk(
+            branch=m_type,
+            version=magisk["version"],
+            version_code=magisk["versionCode"],
+            link=magisk["link"],
+            note=magisk["note"],
+            changelog=chg,
+        )
+        return await c.send_log_message(
+            config.LOGS_ID,
+            "<b>No data in the database.</b>\n"
+            "<b>Saving Magisk data for the next sync...</b>\n"
+            f"    <b>Magisk</b>: <code>{m_type}</code>\n\n"
+            f"<b>Date</b>: <code>{get_date()}</code>\n"
+            "#Sync #Magisk #Releases",
+        )
+    if _magisk["version"] == magisk["version"] and int(_magisk["version_code"]) == int(
+        magisk["versionCode"]
+    ):
+        return
+
+    # do not send the Magisk Beta if it is the same version of Magisk Stable
+    if m_type == "beta":
+        _magisks = await get_magisk_by_branch(branch="stable")
+        if magisk["version"] == _magisks["version"] or int(
+            magisk["versionCode"]
+        ) == int(_magisks["version_code"]):
             chg = await get_changelog(magisk["note"])
-            await create_magisk(
+            await update_magisk_from_dict(
                 branch=m_type,
-                version=magisk["version"],
-                version_code=magisk["versionCode"],
-                link=magisk["link"],
-                note=magisk["note"],
-                changelog=chg,
+                data={
+                    "version": magisk["version"],
+                    "version_code": int(magisk["versionCode"]),
+                    "link": magisk["link"],
+                    "note": magisk["note"],
+                    "changelog": chg,
+                },
             )
-            return await c.send_log_message(
-                config.LOGS_ID,
-                "<b>No data in the database.</b>\n"
-                "<b>Saving Magisk data for the next sync...</b>\n"
-                f"    <b>Magisk</b>: <code>{m_type}</code>\n\n"
-                f"<b>Date</b>: <code>{date}</code>\n"
-                "#Sync #Magisk #Releases",
-            )
-        if _magisk["version"] == magisk["version"] and int(
-            _magisk["version_code"]
-        ) == int(magisk["versionCode"]):
             return
 
-        # do not send the Magisk Beta if it is the same version of Magisk Stable
-        if m_type == "beta":
-            r = await client.get(MAGISK_URL.format(m_type))
-            data = r.json()
-            magiskb = data["magisk"]
-            _magisks = await get_magisk_by_branch(branch="stable")
-            if magiskb["version"] == _magisks["version"] or int(
-                magiskb["versionCode"]
-            ) == int(_magisks["version_code"]):
-                chg = await get_changelog(magisk["note"])
-                await update_magisk_from_dict(
-                    branch=m_type,
-                    data={
-                        "version": magisk["version"],
-                        "version_code": int(magisk["versionCode"]),
-                        "link": magisk["link"],
-                        "note": magisk["note"],
-                        "changelog": chg,
-                    },
-                )
-                return
-
-        file_name = f"Magisk{m_type.capitalize()}-{magisk['version']}_({magisk['versionCode']}).apk"
-        file_path = DOWNLOAD_DIR + file_name
+    file_name = (
+        f"Magisk{m_type.capitalize()}-{magisk['version']}_({magisk['versionCode']}).apk"
+    )
+    file_path = DOWNLOAD_DIR + file_name
+    changelog = asyncio.create_task(get_changelog(magisk["note"]))
+    try:
         async with aiodown.Client() as client:
             download = client.add(magisk["link"], file_path)
             await client.start()
@@ -348,7 +324,11 @@ async def update_magisk(c: Client, m_type: str):
             )
             os.remove(file_path)
 
-    chg = await get_changelog(magisk["note"])
+        chg = await changelog
+    finally:
+        changelog.cancel()
+        with suppress(Exception, asyncio.CancelledError):
+            await changelog
     await update_magisk_from_dict(
         branch=m_type,
         data={
@@ -364,6 +344,6 @@ async def update_magisk(c: Client, m_type: str):
         "<b>Magisk Releases check finished</b>\n"
         f"    <b>Updated</b>: <code>{m_type}</code>\n"
         f"    <b>Version</b>: <code>{magisk['version']} ({magisk['versionCode']})</code>\n\n"
-        f"<b>Date</b>: <code>{date}</code>\n"
+        f"<b>Date</b>: <code>{get_date()}</code>\n"
         "#Sync #Magisk #Releases",
     )
@@ -4,11 +4,10 @@
 import asyncio
 import io
 import os
-from datetime import datetime
-from typing import List
+from contextlib import suppress
+from typing import Dict, List
 
 import aiodown
-import httpx
 import rapidjson as json
 from pyrogram import Client
 from pyrogram.enums import ParseMode
@@ -21,14 +20,20 @@ from androidrepo.database.xposed import (
     get_lsposed_by_branch,
     update_lsposed_from_dict,
 )
-from androidrepo.modules.utils import get_changelog
+from androidrepo.modules.utils import get_changelog, get_date
+from androidrepo.utils import http
 
 DOWNLOAD_DIR: str = "./downloads/LSPosed/"
 LSPOSED_URL: str = "https://lsposed.github.io/LSPosed/release/{}.json"
+TYPES: List[str] = ["riru", "zygisk"]
+DESCRIPTIONS: Dict[str, str] = {
+    "riru": "Another enhanced implementation of Xposed Framework. Requires Riru 25.0.1 or above installed.",
+    "zygisk": "Another enhanced implementation of Xposed Framework. Requires Magisk 24.0+ and Zygisk enabled.",
+}
 
 
 async def get_lsposed(m: Message):
-    date = datetime.now().strftime("%H:%M:%S - %d/%m/%Y")
+    date = get_date()
     lsposeds = await get_all_lsposed()
     lsposed_list = []
     if len(lsposeds) > 0:
@@ -53,50 +58,47 @@ async def get_lsposed(m: Message):
 
 
 async def check_lsposed(c: Client):
-    TYPES: List[str] = ["riru", "zygisk"]
     for lsposed in TYPES:
         await update_lsposed(c, lsposed)
 
 
 async def update_lsposed(c: Client, branch: str):
-    date = datetime.now().strftime("%H:%M:%S - %d/%m/%Y")
-    async with httpx.AsyncClient(
-        http2=True, timeout=40, follow_redirects=True
-    ) as client:
-        response = await client.get(LSPOSED_URL.format(branch))
-        if response.status_code in [500, 503, 504, 505]:
-            return await c.send_log_message(
-                config.LOGS_ID,
-                f"<b>GitHub is in serious trouble, I couldn't complete the verification..</b>\n\n"
-                f"<b>Date</b>: <code>{date}</code>\n"
-                "#Sync #LSPosed #Releases",
-            )
+    response = await http.get(LSPOSED_URL.format(branch))
+    if response.status_code in {500, 503, 504, 505}:
+        return await c.send_log_message(
+            config.LOGS_ID,
+            f"<b>GitHub is in serious trouble, I couldn't complete the verification..</b>\n\n"
+            f"<b>Date</b>: <code>{get_date()}</code>\n"
+            "#Sync #LSPosed #Releases",
+        )
 
-        data = response.json()
-        _lsposed = await get_lsposed_by_branch(branch=branch)
-        if _lsposed is None:
-            chg = await get_changelog(data["changelog"])
-            await create_lsposed(
-                branch=branch,
-                version=data["version"],
-                version_code=data["versionCode"],
-                link=data["zipUrl"],
-                changelog=chg,
-            )
+    data = json.loads(response.content)
+    _lsposed = await get_lsposed_by_branch(branch=branch)
+    if _lsposed is None:
+        chg = await get_changelog(data["changelog"])
+        await create_lsposed(
+            branch=branch,
+            version=data["version"],
+            version_code=data["versionCode"],
+            link=data["zipUrl"],
+            changelog=chg,
+        )
 
-            return await c.send_log_message(
-                config.LOGS_ID,
-                "<b>No data in the database.</b>\n"
-                "<b>Saving LSPosed data for the next sync...</b>\n"
-                f"    <b>LSPosed</b>: <code>{branch}</code>\n\n"
-                f"<b>Date</b>: <code>{date}</code>\n"
-                "#Sync #LSPosed #Releases",
-            )
+        return await c.send_log_message(
+            config.LOGS_ID,
+            "<b>No data in the database.</b>\n"
+            "<b>Saving LSPosed data for the next sync...</b>\n"
+            f"    <b>LSPosed</b>: <code>{branch}</code>\n\n"
+            f"<b>Date</b>: <code>{get_date()}</code>\n"
+            "#Sync #LSPosed #Releases",
+        )
 
-        if _lsposed["version"] == data["version"] or int(
-            _lsposed["version_code"]
-        ) == int(data["versionCode"]):
-            return
+    if _lsposed["version"] == data["version"] or int(_lsposed["version_code"]) == int(
+        data["versionCode"]
+    ):
+        return
+    changelog = asyncio.create_task(get_changelog(data["changelog"]))
+    try:
         async with aiodown.Client() as client:
             file_name = os.path.basename(data["zipUrl"])
             file_path = DOWNLOAD_DIR + file_name
@@ -109,12 +111,7 @@ async def update_lsposed(c: Client, branch: str):
         caption = f"<b>{branch.capitalize()} - LSPosed {data['version']} ({data['versionCode']})</b>\n\n"
 
         caption += "⚡<i>Magisk Module</i>\n"
-        if branch == "riru":
-            caption += "⚡<i>Another enhanced implementation of Xposed Framework. Requires Riru 25.0.1 or above installed.</i>\n"
-
-        elif branch == "zygisk":
-            caption += "⚡<i>Another enhanced implementation of Xposed Framework. Requires Magisk 24.0+ and Zygisk enabled.</i>\n"
-
+        caption += f"⚡<i>{DESCRIPTIONS[branch]}</i>\n"
         caption += (
             "⚡️<a href='https://github.com/LSPosed/LSPosed'>GitHub Repository</a>\n"
         )
@@ -130,22 +127,26 @@ async def update_lsposed(c: Client, branch: str):
         )
 
         os.remove(file_path)
-        chg = await get_changelog(data["changelog"])
-        await update_lsposed_from_dict(
-            branch=branch,
-            data={
-                "version": data["version"],
-                "version_code": int(data["versionCode"]),
-                "link": data["zipUrl"],
-                "changelog": chg,
-            },
-        )
-
-        return await c.send_log_message(
-            config.LOGS_ID,
-            "<b>LSPosed Releases check finished</b>\n"
-            f"    <b>Updated</b>: <code>{branch}</code>\n"
-            f"    <b>Version</b>: <code>{data['version']} ({data['versionCode']})</code>\n\n"
-            f"<b>Date</b>: <code>{date}</code>\n"
-            "#Sync #LSPosed #Releases",
-        )
+        chg = await changelog
+    finally:
+        changelog.cancel()
+        with suppress(Exception, asyncio.CancelledError):
+            await changelog
+    await update_lsposed_from_dict(
+        branch=branch,
+        data={
+            "version": data["version"],
+            "version_code": int(data["versionCode"]),
+            "link": data["zipUrl"],
+            "changelog": chg,
+        },
+    )
+
+    return await c.send_log_message(
+        config.LOGS_ID,
+        "<b>LSPosed Releases check finished</b>\n"
+        f"    <b>Updated</b>: <code>{branch}</code>\n"
+        f"    <b>Version</b>: <code>{data['version']} ({data['versionCode']})</code>\n\n"
+        f"<b>Date</b>: <code>{get_date()}</code>\n"
+        "#Sync #LSPosed #Releases",
+    )
@@ -3,7 +3,7 @@
 
 from typing import List
 
-import httpx
+import rapidjson as json
 from pyrogram import filters
 from pyrogram.enums import ParseMode
 from pyrogram.types import Message
@@ -12,19 +12,18 @@ from androidrepo.bot import AndroidRepo
 from androidrepo.database.xposed import create_lsposed, get_lsposed_by_branch
 from androidrepo.modules.utils import get_changelog
 from androidrepo.modules.utils.xposed import get_lsposed
+from androidrepo.utils import http
 
 TYPES: List[str] = ["riru", "zygisk"]
 
 
 @AndroidRepo.on_message(filters.cmd("lsposed"))
 async def lsposed(c: AndroidRepo, m: Message):
-    command = m.text.split()[0]
-    branch = m.text[len(command) :]
+    args = m.text.split(maxsplit=1)
 
     sm = await m.reply("Checking...")
 
-    branch = "zygisk" if len(branch) < 1 else branch[1:]
-    branch = branch.lower()
+    branch = args[1].lower() if len(args) > 1 else "zygisk"
 
     if branch not in TYPES:
         await sm.edit(f"The version type '<b>{branch}</b>' was not found.")
@@ -32,23 +31,15 @@ async def lsposed(c: AndroidRepo, m: Message):
 
     _lsposed = await get_lsposed_by_branch(branch=branch)
     if _lsposed is None:
-        async with httpx.AsyncClient(
-            http2=True, timeout=40, follow_redirects=True
-        ) as client:
-            r = await client.get(
-                f"https://lsposed.github.io/LSPosed/release/{branch}.json"
-            )
-            lsposed = r.json()
-            await client.aclose()
-        changelog = await get_changelog(lsposed["changelog"])
-        await create_lsposed(
-            branch=branch,
-            version=lsposed["version"],
-            version_code=lsposed["versionCode"],
-            link=lsposed["zipUrl"],
-            changelog=changelog,
-        )
-        _lsposed = await get_lsposed_by_branch(branch=branch)
+        r = await http.get(f"https://lsposed.github.io/LSPosed/release/{branch}.json")
+        lsposed = json.loads(r.content)
+        _lsposed = {
+            "version": lsposed["version"],
+            "version_code": lsposed["versionCode"],
+            "link": lsposed["zipUrl"],
+            "changelog": await get_changelog(lsposed["changelog"]),
+        }
+        await create_lsposed(branch=branch, **_lsposed)
 
     text = f"<b>{branch.capitalize()} - LSPosed</b>"
     text += f"\n\n<b>Version</b>: <code>{_lsposed['version']}</code> (<code>{_lsposed['version_code']}</code>)"
@@ -8,9 +8,14 @@ import platform
 import sys
 from typing import List
 
+import httpx
+
 from . import filters
 
-__all__: List[str] = ["filters"]
+__all__: List[str] = ["filters", "http"]
+
+# Shared HTTP client, so connections are pooled across handlers
+http = httpx.AsyncClient(http2=True, timeout=40, follow_redirects=True)
 
 
 def is_windows() -> bool:
@@ -7,7 +7,9 @@ from typing import Callable, Union
 from pyrogram import Client, filters
 from pyrogram.types import CallbackQuery, Message
 
-from androidrepo.config import PREFIXES
+from androidrepo.config import PREFIXES, STAFF_ID
+
+PREFIXES_TUPLE = tuple(PREFIXES)
 
 
 def command_filter(
@@ -21,25 +23,22 @@ def command_filter(
         pattern += r"(?:\s|$)"
 
     async def func(flt, client: Client, message: Message):
-        value = message.text or message.caption
+        if message.edit_date:
+            return False
 
-        if bool(message.edit_date):
+        value = message.text or message.caption
+        if not value or not value.startswith(PREFIXES_TUPLE):
             return False
 
-        if bool(value):
-            command = value.split()[0]
-            if "@" in command:
-                b = command.split("@")[1]
-                if b.lower() == client.me.username.lower():
-                    value = (
-                        command.split("@")[0]
-                        + (" " if len(value.split()) > 1 else "")
-                        + " ".join(value.split()[1:])
-                    )
-                else:
-                    return False
-
-            message.matches = list(flt.p.finditer(value)) or None
+        words = value.split()
+        if "@" in words[0]:
+            command, username = words[0].split("@")[:2]
+            if username.lower() != client.me.username.lower():
+                return False
+            words[0] = command
+            value = " ".join(words)
+
+        message.matches = list(flt.p.finditer(value)) or None
 
         return bool(message.matches)
 
@@ -57,3 +56,4 @@ async def sudo_filter(_, client, union: Union[CallbackQuery, Message]) -> Callab
 
 filters.cmd = command_filter
 filters.sudo = filters.create(sudo_filter, "SudoFilter")
+filters.staff = filters.chat(STAFF_ID)